@@ -1,20 +1,58 @@
 from typing import Optional, List, Dict, Union
 from pathlib import Path
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
 
+import os
+import json
 import yaml
+import copy
+import shutil
 import pickle
 import tempfile
 import datetime
+import functools
 import subprocess
+import threading
+import weakref
 import re
 import time
 
+try:
+    from yaml import CSafeLoader as _YLoader  # libyaml C parser, ~5-10x faster
+except ImportError:
+    from yaml import SafeLoader as _YLoader
+
 
 # TODO:
 # - Chnage config files to accomodate default commands (such as importing modules and setting up envs)
 #   - Methods pertaining to these commands
 
 
+_SCONTROL_KV = re.compile(r"([A-Za-z_][\w/:]*)=(\S*)")
+_SUBMITTED_RE = re.compile(r"Submitted batch job (\d+)")
+
+# Resolve the Slurm binaries once at import so every subprocess call skips
+# the per-exec PATH search.
+_SBATCH = shutil.which('sbatch') or 'sbatch'
+_SQUEUE = shutil.which('squeue') or 'squeue'
+_SCONTROL = shutil.which('scontrol') or 'scontrol'
+_SCANCEL = shutil.which('scancel') or 'scancel'
+
+
+@functools.lru_cache(maxsize=32)
+def _load_yaml_cached(path_str: str, mtime: float) -> Dict:
+    '''
+    Parse a YAML config file, cached by path and modification time.
+
+    The mtime key means edits to the file invalidate the cached entry while
+    repeated loads of an unchanged file (e.g. sweep drivers constructing many
+    `Slurm()` objects) skip the parse entirely.
+    '''
+    with open(path_str, 'r') as y:
+        return yaml.load(y, Loader=_YLoader) or {}
+
+
 class SlurmConfig:
     '''
     Internal representation of a Slurm job configuration.
@@ -41,26 +79,38 @@ class SlurmConfig:
             Keyword names should use underscores instead of hyphens and will be
             converted automatically.
         '''
-        self._args = {}
+        self._args = dict(kwargs)
         self._commands = []
+        self._rendered: Optional[str] = None
+        self._is_array = 'array' in kwargs
         self.shell = shell or '/bin/bash'
-
-        for key, val in kwargs.items():
-            self._args[key] = val
-            setattr(self, key, val)
+        self.job_name = kwargs.get('job_name', '')
+        vars(self).update(kwargs)
 
     def __repr__(self) -> str:
         return f'SlurmConfig(job_name={self.job_name or None}, partition={self.partition or None}, time={self.time or None})'
     
     def __str__(self) -> str:
-        s = f'#!{self.shell}'
-        for arg, val in self._args.items():
-            arg = arg.replace('_', '-')
-            s += f'\n#SBATCH --{arg}={val}'
-        for command in self._commands:
-            s += f'\n{command}'
-        return s
+        if self._rendered is None:
+            parts = [f'#!{self.shell}']
+            parts.extend(f'#SBATCH --{arg.replace("_", "-")}={val}' for arg, val in self._args.items())
+            parts.extend(self._commands)
+            self._rendered = '\n'.join(parts)
+        return self._rendered
     
+    def __getstate__(self) -> Dict:
+        # The setattr mirror in __init__ duplicates every argument in
+        # __dict__; serialize only the canonical state.
+        return {'shell': self.shell, '_args': self._args, '_commands': self._commands}
+
+    def __setstate__(self, state: Dict) -> None:
+        self.__dict__.update(state)
+        self._rendered = None
+        self._is_array = 'array' in self._args
+        self.job_name = self._args.get('job_name', '')
+        for key, val in self._args.items():
+            setattr(self, key, val)
+
     def add_command(self, cmd : str):
         '''
         Add a shell command to be executed by the job.
@@ -71,6 +121,37 @@ class SlurmConfig:
             A shell command to run inside the Slurm job.
         '''
         self._commands.append(cmd)
+        self._rendered = None
+
+    def to_dict(self) -> Dict:
+        '''
+        Return the configuration as a plain JSON-serializable dict.
+
+        Returns
+        -------
+        dict
+            Mapping with 'shell', 'args', and 'commands' keys.
+        '''
+        return {'shell': self.shell, 'args': dict(self._args), 'commands': list(self._commands)}
+
+    @classmethod
+    def from_dict(cls, d: Dict) -> 'SlurmConfig':
+        '''
+        Reconstruct a SlurmConfig from a `to_dict` mapping.
+
+        Parameters
+        ----------
+        d : dict
+            Mapping produced by `to_dict`.
+
+        Returns
+        -------
+        SlurmConfig
+            A populated SlurmConfig instance.
+        '''
+        config = cls(shell=d.get('shell'), **d.get('args', {}))
+        config._commands = list(d.get('commands', []))
+        return config
 
     def is_array_job(self) -> bool:
         '''
@@ -81,7 +162,7 @@ class SlurmConfig:
         bool
             True if an array argument is present, False otherwise.
         '''
-        return 'array' in self._args.keys()
+        return self._is_array
 
     @classmethod
     def from_yaml(cls, path: str = Path(__file__).parent.resolve() / 'configs' / 'slurm_default.yaml') -> 'SlurmConfig':
@@ -101,12 +182,10 @@ class SlurmConfig:
         SlurmConfig
             A populated SlurmConfig instance.
         '''
-        cls.job_name = ''
-        path = str(path)
-        
-        with open(path, 'r') as y:
-            yaml_data = yaml.safe_load(y) or {}
-        return cls(**yaml_data)
+        path = str(Path(path).resolve())
+
+        yaml_data = _load_yaml_cached(path, os.path.getmtime(path))
+        return cls(**copy.deepcopy(yaml_data))
 
 
 class Slurm:
@@ -118,6 +197,15 @@ class Slurm:
     append commands, submit jobs, and access submitted job objects.
     '''
 
+    # Every live SlurmJob registers itself here so that a single squeue call
+    # can refresh the status of all outstanding jobs at once.
+    _job_registry = weakref.WeakSet()
+    _status_cache: Dict[str, str] = {}
+    _status_cache_queried: set = set()
+    _status_cache_time: float = 0.0
+    _status_cache_ttl: float = 1.0
+    _status_lock = threading.Lock()
+
     def __init__(self, config : SlurmConfig = None):
         '''
         Initialize a Slurm job manager.
@@ -159,19 +247,22 @@ class Slurm:
 
                 val = f'{days}-{hours:02}:{minutes:02}:{seconds:02}'
 
-            if key == 'array' and not isinstance(key, tuple):
+            if key == 'array':
                 if isinstance(val, str):
-                    val = val.split('-')
-                    val = list(map(int, val))
-                    val = range(val[0], val[-1]+1) # slurm arrays are left and right inclusive while python range is only left
+                    lo, _, hi = val.partition('-')
+                    lo, hi = int(lo), int(hi or lo)
                 elif isinstance(val, int):
-                    val = range(0, val+1) # assuming if just int then we include 0
-                self.config._args[key] = f'{val[0]}-{val[-1]}'
-                setattr(self.config, key, val)
+                    lo, hi = 0, val # assuming if just int then we include 0
+                else:
+                    lo, hi = val[0], val[-1]
+                self.config._args[key] = f'{lo}-{hi}'
+                self.config._is_array = True
+                setattr(self.config, key, range(lo, hi+1)) # slurm arrays are left and right inclusive while python range is only left
                 continue
 
             self.config._args[key] = val
             setattr(self.config, key, val)
+        self.config._rendered = None
 
     def add_commands(self, *args) -> None:
         '''
@@ -185,6 +276,7 @@ class Slurm:
         '''
         for cmd in args:
             self.config._commands.append(cmd)
+        self.config._rendered = None
 
     def get_arguments(self) -> Dict[str, str]:
         '''
@@ -230,9 +322,15 @@ class Slurm:
         path = Path(path) or Path(path).parent.resolve() / self.job_name
         path = str(path.with_suffix(suffix))
 
-        with open(path, 'w') as f:
-            f.write(self.config.__str__())
-            return path
+        # Single unbuffered write of the encoded script; the 0o755 mode also
+        # sets the executable bit without a separate chmod.
+        data = str(self.config).encode('utf-8')
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o755)
+        try:
+            os.write(fd, data)
+        finally:
+            os.close(fd)
+        return path
     
     def _serialize_config(self, path: str, suffix: str = '.pkl') -> None:
         '''
@@ -243,19 +341,26 @@ class Slurm:
         path : str or Path
             Output path.
         suffix : str, optional
-            File extension for the serialized configuration.
+            File extension for the serialized configuration. Use '.json' for
+            a compact, pickle-free dump via `SlurmConfig.to_dict`; anything
+            else falls back to pickle for compatibility.
         '''
         path = Path(path) or Path(path).parent.resolve() / f'{self.job_name}'
         path = str(path.with_suffix(suffix))
 
+        if suffix == '.json':
+            with open(path, 'w') as p:
+                json.dump(self.config.to_dict(), p)
+                return path
+
         with open(path, 'wb') as p:
-            pickle.dump(self.config, p)
+            pickle.dump(self.config, p, protocol=pickle.HIGHEST_PROTOCOL)
             return path
         
     def is_array_job(self) -> bool:
         return self.config.is_array_job()
     
-    def sbatch(self, shell: str = None, save_configuration: bool = True, output_path: str = None) -> List[Optional['SlurmJob']]:
+    def sbatch(self, shell: str = None, save_configuration: bool = True, output_path: str = None, persist_script: bool = True) -> List[Optional['SlurmJob']]:
         '''
         Submit the job to Slurm using `sbatch`.
 
@@ -271,6 +376,10 @@ class Slurm:
             Whether to pickle and save the SlurmConfig.
         output_path : str or Path, optional
             Directory where scripts and configs will be written.
+        persist_script : bool, optional
+            Whether to write the submission script to disk. When False the
+            script is piped to `sbatch` on stdin, skipping the intermediate
+            file write and re-read.
 
         Returns
         -------
@@ -279,18 +388,22 @@ class Slurm:
         '''
         shell = shell or self.config.shell
         if output_path is None:
-            output_path = Path(__file__).parent.resolve() 
+            output_path = Path(__file__).parent.resolve()
         else:
             output_path = Path(output_path)
-        output_path.mkdir(exist_ok=True)
+        if save_configuration or persist_script:
+            output_path.mkdir(exist_ok=True)
 
         if save_configuration:
             configuration_path = self._serialize_config(path=output_path / f'{self.config.job_name}')
-        submission_script_path = self._write_submission_script(path=output_path / f'{self.config.job_name}')
 
         # Sbatch submission
-        process = subprocess.run(['sbatch', f'{submission_script_path}'], capture_output=True, text=True, check=True)
-        match = re.search(r"Submitted batch job (\d+)", process.stdout)
+        if persist_script:
+            submission_script_path = self._write_submission_script(path=output_path / f'{self.config.job_name}')
+            process = subprocess.run([_SBATCH, f'{submission_script_path}'], capture_output=True, text=True, check=True)
+        else:
+            process = subprocess.run([_SBATCH], input=str(self.config), capture_output=True, text=True, check=True)
+        match = _SUBMITTED_RE.search(process.stdout)
 
         self.stdout = process.stdout
         self.stderr = process.stderr
@@ -299,11 +412,115 @@ class Slurm:
         if match:
             self.job_id = match.group(1)
             if self.config.is_array_job():
-                self.jobs = [SlurmJob(f'{self.job_id}', self, array_num = i) for i in self.config.array]
+                self.jobs = _LazyJobList(f'{self.job_id}', self, list(self.config.array))
             else:
                 self.jobs = [SlurmJob(f'{self.job_id}', self)]
         return self.jobs
-    
+
+    @classmethod
+    def sbatch_many(cls, jobs: List['Slurm'], max_workers: int = 8, **kwargs) -> List[List[Optional['SlurmJob']]]:
+        '''
+        Submit many `Slurm` objects concurrently.
+
+        Each `sbatch` call is I/O-bound on the scheduler RPC, so overlapping
+        submissions with a thread pool drops wallclock from the sum of
+        per-submission latencies to roughly the slowest one. `max_workers`
+        should not exceed the scheduler's MaxSubmitJobs throttle.
+
+        Scripts are piped to `sbatch` on stdin by default: jobs sharing a
+        job_name would otherwise race to write the same script file and
+        submit each other's content. Pass `persist_script=True` only when
+        every job writes to a distinct path.
+
+        Parameters
+        ----------
+        jobs : list of Slurm
+            Configured Slurm objects to submit.
+        max_workers : int, optional
+            Number of concurrent `sbatch` invocations.
+        **kwargs
+            Forwarded to each `sbatch` call.
+
+        Returns
+        -------
+        list of list of SlurmJob
+            The `sbatch` result for each submitted Slurm object, in order.
+        '''
+        kwargs.setdefault('persist_script', False)
+        with ThreadPoolExecutor(max_workers=max_workers) as ex:
+            return list(ex.map(lambda job: job.sbatch(**kwargs), jobs))
+
+    @classmethod
+    def poll_jobs(cls) -> None:
+        '''
+        Refresh the status of every outstanding job with a single `squeue` call.
+
+        All registered, still-outstanding `SlurmJob` instances are queried in
+        one batch and their states stored in a shared cache that
+        `SlurmJob.get_status` reads from. Jobs missing from the output are
+        treated as completed or not found.
+        '''
+        # Serialize refreshes between the background poller and inline
+        # callers so only one squeue runs at a time and the swap below is
+        # never interleaved.
+        with cls._status_lock:
+            # Ids already known terminal would fail the batched query once
+            # the controller purges them (after MinJobAge), so leave them
+            # out entirely.
+            ids = [job._squeue_id for job in cls._job_registry if not job._terminal]
+            if not ids:
+                cls._status_cache = {}
+                cls._status_cache_queried = set()
+                cls._status_cache_time = time.monotonic()
+                return
+
+            try:
+                process = subprocess.run([_SQUEUE, '-h', '-o', '%i %T', '-j', ','.join(ids)], capture_output=True, text=True, check=True)
+                out_lines = process.stdout.splitlines()
+            except subprocess.CalledProcessError:
+                # A single purged id fails the whole batched query; fall back
+                # to per-id queries so one stale job can't freeze everyone
+                # else's status. Ids that fail individually are simply left
+                # out, which reads as completed or not found.
+                out_lines = []
+                for queue_id in ids:
+                    try:
+                        process = subprocess.run([_SQUEUE, '-h', '-o', '%i %T', '-j', queue_id], capture_output=True, text=True, check=True)
+                    except subprocess.CalledProcessError:
+                        continue
+                    out_lines.extend(process.stdout.splitlines())
+
+            statuses = {}
+            for line in out_lines:
+                job_id, _, state = line.partition(' ')
+                if state:
+                    statuses[job_id] = state.strip()
+            # Swap in the parsed result atomically so readers never observe
+            # a cleared-but-unfilled cache mid-refresh. Record which ids
+            # this refresh covered so a cache miss can be told apart from a
+            # job registered after the poll.
+            cls._status_cache = statuses
+            cls._status_cache_queried = set(ids)
+            cls._status_cache_time = time.monotonic()
+
+    def cancel(self) -> bool:
+        '''
+        Cancel this submission with a single `scancel` call.
+
+        Slurm cancels every array task when given the master job id, so this
+        costs one subprocess regardless of array size.
+
+        Returns
+        -------
+        bool
+            True if cancellation was successful, False otherwise.
+        '''
+        try:
+            subprocess.run([_SCANCEL, self.job_id], check=True, capture_output=True)
+            return True
+        except subprocess.CalledProcessError:
+            return False
+
 
 class SlurmJob:
     '''
@@ -314,7 +531,7 @@ class SlurmJob:
     cancelling jobs.
     '''
 
-    def __init__(self, job_id: str, slurm: Slurm, array_num:Union[int, str]):
+    def __init__(self, job_id: str, slurm: Slurm, array_num:Union[int, str] = None):
         '''
         Initialize a SlurmJob instance.
 
@@ -324,26 +541,62 @@ class SlurmJob:
             Slurm job ID assigned by the scheduler.
         slurm : Slurm
             Parent Slurm object that submitted the job.
-        array_num : int or str
+        array_num : int or str, optional
             Array index for array jobs.
         '''
         self.job_id = job_id
         self.slurm = slurm
-        self.array_num = int(array_num)
-        self.__dict__.update(slurm.__dict__)
+        self.array_num = int(array_num) if array_num is not None else None
+        self._terminal = False
 
         if self.slurm.is_array_job():
             self.array_job_id = f'{self.job_id}_{self.array_num}'
-        
-        self.submission_details = self._get_scontrol_attrs()
+
+        # poll_jobs iterates the registry under _status_lock from the poller
+        # thread; take the same lock so registering from worker threads
+        # (sbatch_many, lazy array lists) can't mutate it mid-iteration.
+        with Slurm._status_lock:
+            Slurm._job_registry.add(self)
         # self.submission_config = SlurmConfig(**self.submission_details) # Class has capacity to hold this data but it treats it like a slurm submission
-    
+
     def __str__(self) -> str:
         return self.job_id
-    
+
     def __repr__(self) -> str:
         return f'SlurmJob(job_id={self.job_id})'
-    
+
+    def __getattr__(self, name):
+        # Fall through to the parent Slurm object instead of copying its state
+        # into every job; guard against recursion before `slurm` is assigned.
+        if name == 'slurm':
+            raise AttributeError(name)
+        return getattr(self.slurm, name)
+
+    @property
+    def _squeue_id(self) -> str:
+        '''
+        Identifier used to match this job in `squeue` output.
+
+        Returns
+        -------
+        str
+            The per-task array id (e.g. 123_4) for array jobs, otherwise the
+            plain job id.
+        '''
+        return getattr(self, 'array_job_id', self.job_id)
+
+    @functools.cached_property
+    def submission_details(self) -> Dict[str, str]:
+        '''
+        Job submission details from `scontrol show job`, fetched on first access.
+
+        Returns
+        -------
+        dict
+            Mapping of Slurm job attributes to values.
+        '''
+        return self._get_scontrol_attrs()
+
     def _get_scontrol_attrs(self) -> Dict[str, str]:
         '''
         Retrieve job submission details using `scontrol show job`.
@@ -353,19 +606,17 @@ class SlurmJob:
         dict
             Mapping of Slurm job attributes to values.
         '''
-        process = subprocess.run(['scontrol', 'show', 'job', self.job_id],capture_output=True, text=True, check=True)
-        submission_details = {}
-        for attr in process.stdout.split(' '):
-            attr = attr.strip()
-            if attr:
-                key, val = attr.split('=', 1)
-                submission_details[key] = val
-        return submission_details
-        
+        process = subprocess.run([_SCONTROL, 'show', 'job', self.job_id],capture_output=True, text=True, check=True)
+        return dict(_SCONTROL_KV.findall(process.stdout))
+
 
     def get_status(self):
         '''
-        Query the current job status using `squeue`.
+        Query the current job status from the shared `squeue` cache.
+
+        Statuses for every outstanding job are fetched in one batch by
+        `Slurm.poll_jobs` and cached briefly, so checking N array tasks costs
+        a single subprocess spawn instead of N.
 
         Returns
         -------
@@ -373,29 +624,39 @@ class SlurmJob:
             Slurm job state (e.g. PENDING, RUNNING) or
             'COMPLETED or NOT FOUND' if the job is no longer queued.
         '''
-        try:
-            process = subprocess.run(["squeue", "-j", self.job_id, "-h", "-o", "%T"],capture_output=True, text=True, check=True)
-            if process.stdout:
-                return process.stdout.strip()
-            else:
-                return 'COMPLETED or NOT FOUND'
-        except subprocess.CalledProcessError:
+        if self._terminal:
             return 'COMPLETED or NOT FOUND'
-        
-    def hold_for_completion(self, interval:int = 3) -> None:
+        # A live background poller keeps the cache fresh; only refresh inline
+        # when no poller is running.
+        if not _StatusPoller.active() and time.monotonic() - Slurm._status_cache_time > Slurm._status_cache_ttl:
+            Slurm.poll_jobs()
+        status = Slurm._status_cache.get(self._squeue_id)
+        if status is None and self._squeue_id not in Slurm._status_cache_queried:
+            # This job was registered after the last refresh; a miss from a
+            # poll that never asked about its id says nothing, so refresh
+            # once before deciding.
+            Slurm.poll_jobs()
+            status = Slurm._status_cache.get(self._squeue_id)
+        if status is None:
+            # Only latch the terminal state when a refresh that actually
+            # queried this id came back without it.
+            if self._squeue_id in Slurm._status_cache_queried:
+                self._terminal = True
+            return 'COMPLETED or NOT FOUND'
+        return status
+
+    def hold_for_completion(self, interval:int = 3, max_interval:int = 60) -> None:
         '''
         Block execution until the job has completed.
 
         Parameters
         ----------
         interval : int, optional
-            Time in seconds between status checks.
+            Initial time in seconds between status checks.
+        max_interval : int, optional
+            Cap on the check interval as it backs off.
         '''
-        while True:
-            if self.is_queued():
-                time.sleep(interval)
-                continue
-            break
+        wait_all([self], interval=interval, max_interval=max_interval)
 
     def is_queued(self) -> bool:
         '''
@@ -408,25 +669,162 @@ class SlurmJob:
         '''
         return self.get_status() in ('PENDING', 'RUNNING')
     
-    def cancel(self) -> bool:
+    def cancel(self, cancel_all: bool = False) -> bool:
         '''
         Cancel the job using `scancel`.
 
+        Parameters
+        ----------
+        cancel_all : bool, optional
+            Cancel the entire submission (all array tasks) through the parent
+            Slurm object with one `scancel`, instead of just this task.
+
         Returns
         -------
         bool
             True if cancellation was successful, False otherwise.
         '''
-        if not self.is_queued:
+        if cancel_all:
+            return self.slurm.cancel()
+
+        if not self.is_queued():
             return False
 
         try:
-            subprocess.run(["scancel", self.job_id], check=True, capture_output=True)
+            subprocess.run([_SCANCEL, self._squeue_id], check=True, capture_output=True)
             return True
         except subprocess.CalledProcessError:
             return False
 
 
+class _LazyJobList(Sequence):
+    '''
+    Sequence of array-task `SlurmJob`s materialized on access.
+
+    Submitting a large array eagerly built one `SlurmJob` per task; this
+    keeps submission O(1) and constructs each job on first access, then
+    memoizes it so repeated indexing returns the same object and per-job
+    state (cached scontrol details, terminal status) is preserved.
+    '''
+
+    def __init__(self, job_id: str, slurm: Slurm, indices: List[int]):
+        self.job_id = job_id
+        self.slurm = slurm
+        self.indices = indices
+        self._cache: Dict[int, SlurmJob] = {}
+
+    def __getitem__(self, i) -> Union[SlurmJob, List[SlurmJob]]:
+        if isinstance(i, slice):
+            return [self[idx] for idx in range(*i.indices(len(self.indices)))]
+        if i < 0:
+            i += len(self.indices)
+        job = self._cache.get(i)
+        if job is None:
+            job = SlurmJob(self.job_id, self.slurm, array_num=self.indices[i])
+            self._cache[i] = job
+        return job
+
+    def __len__(self) -> int:
+        return len(self.indices)
+
+    def __repr__(self) -> str:
+        return f'_LazyJobList(job_id={self.job_id}, tasks={len(self.indices)})'
+
+
+class _StatusPoller(threading.Thread):
+    '''
+    Daemon thread that refreshes the shared job-status cache in the background.
+
+    While the poller is live, `SlurmJob.get_status` reads the cache without
+    triggering its own refresh, so any number of jobs checked at any rate
+    cost one `squeue` call per poll interval.
+    '''
+
+    _instance: Optional['_StatusPoller'] = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self, interval: int = 3, max_interval: int = 60):
+        super().__init__(daemon=True)
+        self._interval = interval
+        self._max_interval = max_interval
+        self._live = True
+
+    @classmethod
+    def singleton(cls, interval: int = 3, max_interval: int = 60) -> '_StatusPoller':
+        '''
+        Return the running poller, starting one if necessary.
+
+        Parameters
+        ----------
+        interval : int, optional
+            Initial time in seconds between background polls for a newly
+            started poller.
+        max_interval : int, optional
+            Cap on the poll interval as it backs off.
+        '''
+        with cls._instance_lock:
+            if not cls.active():
+                cls._instance = cls(interval, max_interval)
+                cls._instance.start()
+            return cls._instance
+
+    @classmethod
+    def active(cls) -> bool:
+        '''
+        Check whether a live background poller is refreshing the cache.
+        '''
+        instance = cls._instance
+        return instance is not None and instance._live and instance.is_alive()
+
+    def stop(self) -> None:
+        '''
+        Ask the poller to exit after its current cycle.
+        '''
+        self._live = False
+
+    def run(self) -> None:
+        # Back off like wait_all does, so long waits don't keep spawning
+        # squeue at the initial rate.
+        cur = self._interval
+        while self._live:
+            Slurm.poll_jobs()
+            time.sleep(cur)
+            cur = min(cur * 2, self._max_interval)
+
+
+def wait_all(jobs: List[SlurmJob], interval: int = 3, max_interval: int = 60) -> None:
+    '''
+    Block until every job in `jobs` has left the queue.
+
+    All jobs are polled together, so each cycle costs one `squeue` call
+    regardless of how many jobs are being waited on. The poll interval
+    doubles each cycle up to `max_interval`, so long-running jobs are not
+    hammered with status checks.
+
+    Parameters
+    ----------
+    jobs : list of SlurmJob
+        Jobs to wait on.
+    interval : int, optional
+        Initial time in seconds between status checks.
+    max_interval : int, optional
+        Cap on the check interval as it backs off.
+    '''
+    jobs = list(jobs)
+    # Prime the cache before the first is_queued check; once the poller is
+    # active, get_status trusts the cache, and an unprimed one would make
+    # every job look terminal immediately.
+    Slurm.poll_jobs()
+    poller = _StatusPoller.singleton(interval, max_interval)
+    try:
+        cur = interval
+        while any(job.is_queued() for job in jobs):
+            time.sleep(cur)
+            cur = min(cur * 2, max_interval)
+    finally:
+        poller.stop()
+
+
 if __name__ == '__main__':
     dir = Path(__file__).parent.resolve()
 
@@ -441,6 +839,5 @@ if __name__ == '__main__':
     slurm.sbatch(output_path=Path(__file__).parent.resolve() / 'outputs')
     
     if slurm.is_array_job():
-        for job in slurm.jobs:
-            job.hold_for_completion()
+        wait_all(slurm.jobs)
             
\ No newline at end of file